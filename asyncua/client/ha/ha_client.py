@@ -4,7 +4,6 @@ import logging
 
 from dataclasses import dataclass, field
 from enum import IntEnum
-from functools import partial
 from itertools import chain
 from sortedcontainers import SortedDict  # type: ignore
 from asyncua import Node, ua, Client
@@ -547,17 +546,21 @@ class HaManager:
                 _logger.info(f"Virtually reconnecting and resubscribing {client}")
                 await self.ha_client.reconnect(client=client)
 
-        def log_exception(client: Client, fut: asyncio.Task):
-            if fut.exception():
-                _logger.warning(f"Error when reconnecting {client}: {fut.exception()}")
+        def log_exception(client: Client):
+            # plain closure instead of functools.partial: no argument-merging
+            # indirection when the event loop fires the done callback
+            def _log(fut: asyncio.Task):
+                if fut.exception():
+                    _logger.warning(f"Error when reconnecting {client}: {fut.exception()}")
+            return _log
 
         tasks = []
         for client in healthy:
             task = asyncio.create_task(reco_resub(client, force=False))
-            task.add_done_callback(partial(log_exception, client))
+            task.add_done_callback(log_exception(client))
             tasks.append(task)
         for client in unhealthy:
             task = asyncio.create_task(reco_resub(client, force=True))
-            task.add_done_callback(partial(log_exception, client))
+            task.add_done_callback(log_exception(client))
             tasks.append(task)
         await asyncio.gather(*tasks, return_exceptions=True)
@@ -2,14 +2,33 @@
 Low level binary client
 """
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from asyncua import ua
-from ..ua.ua_binary import struct_from_binary, uatcp_to_binary, struct_to_binary, nodeid_from_binary, header_from_binary
+from ..ua.ua_binary import Primitives, struct_from_binary, uatcp_to_binary, struct_to_binary, nodeid_from_binary, header_from_binary
 from ..ua.uaerrors import BadTimeout, BadNoSubscription, BadSessionClosed, UaStructParsingError
 from ..common.connection import SecureConnection
 
+# Parsers bound to their response class, built lazily. Looking up the bound
+# parser in this dict is cheaper than re-resolving struct_from_binary and the
+# response class on every single request.
+_response_parsers: Dict[type, Callable] = {}
+
+# The TypeId carried by every ServiceFault response, built once instead of on
+# each check_answer call. NodeId is a frozen dataclass so sharing it is safe.
+_SERVICE_FAULT_TYPEID = ua.FourByteNodeId(ua.ObjectIds.ServiceFault_Encoding_DefaultBinary)
+
+
+def _parse_response(response_class, data):
+    try:
+        parser = _response_parsers[response_class]
+    except KeyError:
+        parser = _response_parsers.setdefault(response_class, functools.partial(struct_from_binary, response_class))
+    return parser(data)
+
 
 class UASocketProtocol(asyncio.Protocol):
     """
@@ -27,14 +46,32 @@ class UASocketProtocol(asyncio.Protocol):
         """
         self.logger = logging.getLogger(f"{__name__}.UASocketProtocol")
         self.transport: Optional[asyncio.Transport] = None
-        self.receive_buffer: Optional[bytes] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Incoming stream accumulator: chunks are appended in place and parsing
+        # resumes from _incoming_pos, so partially received messages never force
+        # a re-copy of the data already buffered.
+        self._incoming_buf = bytearray()
+        self._incoming_pos = 0
         self.is_receiving = False
         self.timeout = timeout
         self.authentication_token = ua.NodeId()
-        self._request_id = 0
-        self._request_handle = 0
+        # id/handle generators, incremented in C instead of load/add/store per request
+        self._next_request_id = itertools.count(1).__next__
+        self._next_request_handle = itertools.count(1).__next__
         self._callbackmap: Dict[int, asyncio.Future] = {}
         self._connection = SecureConnection(security_policy)
+        # Outgoing messages are coalesced per event-loop tick and flushed with a
+        # single writelines() call, so many small back-to-back requests do not
+        # each pay for their own transport write.
+        self._pending_writes: List[bytes] = []
+        self._flush_scheduled = False
+        # exact-type dispatch table: a single dict lookup per incoming message
+        # instead of a chain of isinstance checks
+        self._message_handlers = {
+            ua.Message: self._handle_message,
+            ua.Acknowledge: self._handle_acknowledge,
+            ua.ErrorMessage: self._handle_error_message,
+        }
         self.state = self.INITIALIZED
         self.closed: bool = False
         # needed to pass params from asynchronous request to synchronous data receive callback, as well as
@@ -44,6 +81,7 @@ class UASocketProtocol(asyncio.Protocol):
     def connection_made(self, transport: asyncio.Transport):  # type: ignore
         self.state = self.OPEN
         self.transport = transport
+        self._loop = asyncio.get_running_loop()
 
     def connection_lost(self, exc: Optional[Exception]):
         self.logger.info("Socket has closed connection")
@@ -51,29 +89,30 @@ class UASocketProtocol(asyncio.Protocol):
         self.transport = None
 
     def data_received(self, data: bytes):
-        if self.receive_buffer:
-            data = self.receive_buffer + data
-            self.receive_buffer = None
-        self._process_received_data(data)
+        self._incoming_buf += data
+        self._process_received_data()
 
-    def _process_received_data(self, data: bytes):
+    def _process_received_data(self):
         """
         Try to parse received data as asyncua message. Data may be chunked but will be in correct order.
         See: https://docs.python.org/3/library/asyncio-protocol.html#asyncio.Protocol.data_received
         Reassembly is done by filling up a buffer until it verifies as a valid message (or a MessageChunk).
+        Chunks are consumed synchronously inside this protocol callback; there is deliberately no
+        intermediate queue between the socket and the parser, so no per-chunk waiter machinery either.
         """
-        buf = ua.utils.Buffer(data)
+        buf = ua.utils.Buffer(self._incoming_buf, self._incoming_pos)
         while True:
             try:
+                start_pos = buf.cur_pos
                 try:
                     header = header_from_binary(buf)
                 except ua.utils.NotEnoughData:
                     self.logger.debug('Not enough data while parsing header from server, waiting for more')
-                    self.receive_buffer = data
+                    self._trim_incoming(start_pos)
                     return
                 if len(buf) < header.body_size:
                     self.logger.debug('We did not receive enough data from server. Need %s got %s', header.body_size, len(buf))
-                    self.receive_buffer = data
+                    self._trim_incoming(start_pos)
                     return
                 msg = self._connection.receive_from_header_and_body(header, buf)
                 self._process_received_message(msg)
@@ -84,26 +123,46 @@ class UASocketProtocol(asyncio.Protocol):
                     self._open_secure_channel_exchange = response
                     self._connection.set_channel(response.Parameters, params.RequestType, params.ClientNonce)
                 if not buf:
+                    # everything consumed: drop the backing buffer so it cannot grow unbounded
+                    self._incoming_buf.clear()
+                    self._incoming_pos = 0
                     return
-                # Buffer still has bytes left, try to process again
-                data = bytes(buf)
+                # Buffer still has bytes left, try to process again without re-copying them
             except Exception:
                 self.logger.exception('Exception raised while parsing message from server')
+                self._incoming_buf.clear()
+                self._incoming_pos = 0
                 self.disconnect_socket()
                 return
 
+    def _trim_incoming(self, pos: int):
+        """
+        Remember how far parsing got. The consumed prefix is only compacted away
+        once it dominates the buffer, so waiting for the rest of a partially
+        received message does not re-copy the tail on every socket read.
+        """
+        if pos >= 4096 and pos * 2 >= len(self._incoming_buf):
+            del self._incoming_buf[:pos]
+            pos = 0
+        self._incoming_pos = pos
+
     def _process_received_message(self, msg: Union[ua.Message, ua.Acknowledge, ua.ErrorMessage]):
         if msg is None:
-            pass
-        elif isinstance(msg, ua.Message):
-            self._call_callback(msg.request_id(), msg.body())
-        elif isinstance(msg, ua.Acknowledge):
-            self._call_callback(0, msg)
-        elif isinstance(msg, ua.ErrorMessage):
-            self.logger.fatal("Received an error: %r", msg)
-            self._call_callback(0, ua.UaStatusCodeError(msg.Error.value))
-        else:
+            return
+        handler = self._message_handlers.get(type(msg))
+        if handler is None:
             raise ua.UaError(f"Unsupported message type: {msg}")
+        handler(msg)
+
+    def _handle_message(self, msg: ua.Message):
+        self._call_callback(msg.request_id(), msg.body())
+
+    def _handle_acknowledge(self, msg: ua.Acknowledge):
+        self._call_callback(0, msg)
+
+    def _handle_error_message(self, msg: ua.ErrorMessage):
+        self.logger.fatal("Received an error: %r", msg)
+        self._call_callback(0, ua.UaStatusCodeError(msg.Error.value))
 
     def _send_request(self, request, timeout: float = 1, message_type=ua.MessageType.SecureMessage) -> asyncio.Future:
         """
@@ -116,26 +175,41 @@ class UASocketProtocol(asyncio.Protocol):
         """
         self._setup_request_header(request.RequestHeader, timeout)
         self.logger.debug('Sending: %s', request)
-        try:
-            binreq = struct_to_binary(request)
-        except Exception:
-            # reset request handle if any error
-            # see self._setup_request_header
-            self._request_handle -= 1
-            raise
-        self._request_id += 1
-        future = asyncio.get_running_loop().create_future()
-        self._callbackmap[self._request_id] = future
+        # If serialization fails the handle generated for this request is simply
+        # skipped; handles only need to be unique, not consecutive, and nothing
+        # has been sent to the server yet.
+        binreq = struct_to_binary(request)
+        request_id = self._next_request_id()
+        future = self._loop.create_future()
+        self._callbackmap[request_id] = future
 
         # Change to the new security token if the connection has been renewed.
         if self._connection.next_security_token.TokenId != 0:
             self._connection.revolve_tokens()
 
-        msg = self._connection.message_to_binary(binreq, message_type=message_type, request_id=self._request_id)
-        if self.transport is not None:
-            self.transport.write(msg)
+        msg = self._connection.message_to_binary(binreq, message_type=message_type, request_id=request_id)
+        self._write(msg)
         return future
 
+    def _write(self, msg: bytes):
+        """
+        Queue an outgoing message and schedule a flush on the current event-loop
+        tick. Requests issued back-to-back without awaiting in between end up in
+        one writelines() call instead of one transport.write() each.
+        """
+        self._pending_writes.append(msg)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush_writes)
+
+    def _flush_writes(self):
+        self._flush_scheduled = False
+        if not self._pending_writes:
+            return
+        msgs, self._pending_writes = self._pending_writes, []
+        if self.transport is not None:
+            self.transport.writelines(msgs)
+
     async def send_request(self, request, timeout: Optional[float] = None, message_type=ua.MessageType.SecureMessage):
         """
         Send a request to the server.
@@ -144,7 +218,13 @@ class UASocketProtocol(asyncio.Protocol):
         """
         timeout = self.timeout if timeout is None else timeout
         try:
-            data = await asyncio.wait_for(self._send_request(request, timeout, message_type), timeout if timeout else None)
+            future = self._send_request(request, timeout, message_type)
+            if timeout:
+                data = await asyncio.wait_for(future, timeout)
+            else:
+                # no client-side deadline (e.g. publish requests pass timeout=0),
+                # so await the response future directly without wait_for wrapping
+                data = await future
         except Exception:
             if self.state != self.OPEN:
                 raise ConnectionError("Connection is closed") from None
@@ -155,13 +235,15 @@ class UASocketProtocol(asyncio.Protocol):
         return data
 
     def check_answer(self, data, context):
-        data = data.copy()
+        start_pos = data.cur_pos
         typeid = nodeid_from_binary(data)
-        if typeid == ua.FourByteNodeId(ua.ObjectIds.ServiceFault_Encoding_DefaultBinary):
+        if typeid == _SERVICE_FAULT_TYPEID:
             hdr = struct_from_binary(ua.ResponseHeader, data)
             self.logger.warning("ServiceFault (%s, diagnostics: %s) from server received %s", hdr.ServiceResult.name, hdr.ServiceDiagnostics, context)
             hdr.ServiceResult.check()
             return False
+        # Not a fault: rewind so the caller can parse the complete response
+        data.rewind(cur_pos=start_pos)
         return True
 
     def _call_callback(self, request_id, body):
@@ -182,13 +264,14 @@ class UASocketProtocol(asyncio.Protocol):
         :param timeout: Timeout in seconds
         """
         hdr.AuthenticationToken = self.authentication_token
-        self._request_handle += 1
-        hdr.RequestHandle = self._request_handle
+        hdr.RequestHandle = self._next_request_handle()
         hdr.TimeoutHint = int(timeout * 1000)
 
     def disconnect_socket(self):
         self.logger.info("Request to close socket received")
         if self.transport:
+            # flush anything still queued for the current tick before closing
+            self._flush_writes()
             self.transport.close()
         else:
             self.logger.warning("disconnect_socket was called but transport is None")
@@ -198,10 +281,9 @@ class UASocketProtocol(asyncio.Protocol):
         hello.EndpointUrl = url
         hello.MaxMessageSize = max_messagesize
         hello.MaxChunkCount = max_chunkcount
-        ack = asyncio.Future()
+        ack = self._loop.create_future()
         self._callbackmap[0] = ack
-        if self.transport is not None:
-            self.transport.write(uatcp_to_binary(ua.MessageType.Hello, hello))
+        self._write(uatcp_to_binary(ua.MessageType.Hello, hello))
         return await asyncio.wait_for(ack, self.timeout)
 
     async def open_secure_channel(self, params):
@@ -256,6 +338,52 @@ class UaClient:
     def set_security(self, policy: ua.SecurityPolicy):
         self.security_policy = policy
 
+    @staticmethod
+    def use_uvloop() -> None:
+        """
+        Install the uvloop event loop policy so that all loops created afterwards
+        use uvloop instead of the default selector loop. uvloop performs fewer
+        syscalls per read/write round-trip, which directly benefits the small
+        request/response and publish/notification ping-pong of OPC UA.
+
+        uvloop is an optional dependency and is never imported unless this is
+        called. Call it once, before the event loop is created (i.e. before
+        asyncio.run or connect).
+        """
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    async def batch(self, *coros):
+        """
+        Issue several independent service calls concurrently over this connection::
+
+            results, endpoints = await uaclient.batch(
+                uaclient.read(read_params),
+                uaclient.get_endpoints(endpoint_params),
+            )
+
+        All requests are serialized and written before any reply is awaited
+        (back-to-back requests are even coalesced into a single socket write),
+        so n independent calls cost roughly one network round-trip instead of n.
+        Sequentially awaiting each call instead serializes on the RTT.
+        """
+        return await asyncio.gather(*coros)
+
+    async def _service_call(self, request, response_class):
+        """
+        Send a service request, parse the response with the cached parser
+        for response_class and check the service result.
+        All service methods go through here; this is the hot path of the client.
+        """
+        data = await self.protocol.send_request(request)
+        response = _parse_response(response_class, data)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # guard explicitly: formatting the repr of a large response is
+            # expensive even when the debug record would be thrown away
+            self.logger.debug(response)
+        response.ResponseHeader.ServiceResult.check()
+        return response
+
     def _make_protocol(self):
         self.protocol = UASocketProtocol(self._timeout, security_policy=self.security_policy)
         return self.protocol
@@ -295,10 +423,7 @@ class UaClient:
         self.protocol.closed = False
         request = ua.CreateSessionRequest()
         request.Parameters = parameters
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.CreateSessionResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.CreateSessionResponse)
         self.protocol.authentication_token = response.Parameters.AuthenticationToken
         return response.Parameters
 
@@ -306,10 +431,7 @@ class UaClient:
         self.logger.info("activate_session")
         request = ua.ActivateSessionRequest()
         request.Parameters = parameters
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.ActivateSessionResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.ActivateSessionResponse)
         return response.Parameters
 
     async def close_session(self, delete_subscriptions):
@@ -320,15 +442,19 @@ class UaClient:
         self.protocol.closed = True
         if self._publish_task and not self._publish_task.done():
             self._publish_task.cancel()
+            try:
+                await self._publish_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                self.logger.exception("Publish task raised while being cancelled")
         if self.protocol and self.protocol.state == UASocketProtocol.CLOSED:
             self.logger.warning("close_session was called but connection is closed")
             return
         request = ua.CloseSessionRequest()
         request.DeleteSubscriptions = delete_subscriptions
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.CloseSessionResponse, data)
         try:
-            response.ResponseHeader.ServiceResult.check()
+            await self._service_call(request, ua.CloseSessionResponse)
         except BadSessionClosed:
             # Problem: closing the session with open publish requests leads to BadSessionClosed responses
             #          we can just ignore it therefore.
@@ -340,100 +466,70 @@ class UaClient:
         self.logger.info("browse")
         request = ua.BrowseRequest()
         request.Parameters = parameters
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.BrowseResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.BrowseResponse)
         return response.Results
 
     async def browse_next(self, parameters):
         self.logger.debug("browse next")
         request = ua.BrowseNextRequest()
         request.Parameters = parameters
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.BrowseNextResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.BrowseNextResponse)
         return response.Parameters.Results
 
     async def read(self, parameters):
         self.logger.debug("read")
         request = ua.ReadRequest()
         request.Parameters = parameters
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.ReadResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.ReadResponse)
         return response.Results
 
     async def write(self, params):
         self.logger.debug("write")
         request = ua.WriteRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.WriteResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.WriteResponse)
         return response.Results
 
     async def get_endpoints(self, params):
         self.logger.debug("get_endpoint")
         request = ua.GetEndpointsRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.GetEndpointsResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.GetEndpointsResponse)
         return response.Endpoints
 
     async def find_servers(self, params):
         self.logger.debug("find_servers")
         request = ua.FindServersRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.FindServersResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.FindServersResponse)
         return response.Servers
 
     async def find_servers_on_network(self, params):
         self.logger.debug("find_servers_on_network")
         request = ua.FindServersOnNetworkRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.FindServersOnNetworkResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.FindServersOnNetworkResponse)
         return response.Parameters
 
     async def register_server(self, registered_server):
         self.logger.debug("register_server")
         request = ua.RegisterServerRequest()
         request.Server = registered_server
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.RegisterServerResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        await self._service_call(request, ua.RegisterServerResponse)
         # nothing to return for this service
 
     async def register_server2(self, params):
         self.logger.debug("register_server2")
         request = ua.RegisterServer2Request()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.RegisterServer2Response, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.RegisterServer2Response)
         return response.ConfigurationResults
 
     async def translate_browsepaths_to_nodeids(self, browse_paths):
         self.logger.debug("translate_browsepath_to_nodeid")
         request = ua.TranslateBrowsePathsToNodeIdsRequest()
         request.Parameters.BrowsePaths = browse_paths
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.TranslateBrowsePathsToNodeIdsResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.TranslateBrowsePathsToNodeIdsResponse)
         return response.Results
 
     async def create_subscription(
@@ -442,19 +538,19 @@ class UaClient:
         self.logger.debug("create_subscription")
         request = ua.CreateSubscriptionRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.CreateSubscriptionResponse, data)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.CreateSubscriptionResponse)
         self._subscription_callbacks[response.Parameters.SubscriptionId] = callback
         self.logger.info(
             "create_subscription success SubscriptionId %s",
             response.Parameters.SubscriptionId
         )
-        if not self._publish_task or self._publish_task.done() :
-            # Start the publish loop if it is not yet running
-            # The current strategy is to have only one open publish request per UaClient. This might not be enough
-            # in high latency networks or in case many subscriptions are created. A Set of Tasks of `_publish_loop`
-            # could be used if necessary.
+        if not self._publish_task or self._publish_task.done():
+            # Start the publish loop if it is not yet running.
+            # The deliberate strategy is a single long-lived publish task per UaClient that reposts
+            # immediately on completion, instead of spawning a coroutine per PublishRequest; that keeps
+            # one request in flight with no per-publish task/frame allocations. This might not be enough
+            # in high latency networks or in case many subscriptions are created. A Set of Tasks of
+            # `_publish_loop` could be used if necessary.
             self._publish_task = asyncio.create_task(self._publish_loop())
         return response.Parameters
 
@@ -463,9 +559,7 @@ class UaClient:
     ) -> ua.ModifySubscriptionResult:
         request = ua.ModifySubscriptionRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.ModifySubscriptionResponse, data)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.ModifySubscriptionResponse)
         self.logger.info(
             "update_subscription success SubscriptionId %s",
             params.SubscriptionId
@@ -476,9 +570,7 @@ class UaClient:
         self.logger.debug("delete_subscriptions %r", subscription_ids)
         request = ua.DeleteSubscriptionsRequest()
         request.Parameters.SubscriptionIds = subscription_ids
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.DeleteSubscriptionsResponse, data)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.DeleteSubscriptionsResponse)
         self.logger.info("remove subscription callbacks for %r", subscription_ids)
         for sid in subscription_ids:
             self._subscription_callbacks.pop(sid)
@@ -494,21 +586,44 @@ class UaClient:
         data = await self.protocol.send_request(request, timeout=0)
         self.protocol.check_answer(data, "while waiting for publish response")
         try:
-            response = struct_from_binary(ua.PublishResponse, data)
+            response = _parse_response(ua.PublishResponse, data)
         except Exception as ex:
             self.logger.exception("Error parsing notification from server")
             raise UaStructParsingError from ex
         return response
 
+    @staticmethod
+    def _peek_subscription_id(data) -> int:
+        """
+        Read the SubscriptionId of a binary PublishResponse without decoding the
+        notification payload, restoring the buffer position afterwards.
+        SubscriptionId is the first field after the TypeId and the ResponseHeader.
+        """
+        pos = data.cur_pos
+        try:
+            nodeid_from_binary(data)  # TypeId
+            struct_from_binary(ua.ResponseHeader, data)
+            return Primitives.UInt32.unpack(data)
+        finally:
+            data.rewind(cur_pos=pos)
+
     async def _publish_loop(self):
         """
         Start a loop that sends a publish requests and waits for the publish responses.
         Forward the `PublishResult` to the matching `Subscription` by callback.
+        The SubscriptionId is peeked from the binary response first; the payload
+        (potentially hundreds of notifications) is only decoded when a callback
+        is still registered for that subscription.
         """
         ack = None
         while True:
+            acks = [ack] if ack else []
+            self.logger.debug('publish %r', acks)
+            request = ua.PublishRequest()
+            request.Parameters.SubscriptionAcknowledgements = acks
             try:
-                response = await self.publish([ack] if ack else [])
+                data = await self.protocol.send_request(request, timeout=0)
+                self.protocol.check_answer(data, "while waiting for publish response")
             except BadTimeout:  # See Spec. Part 4, 7.28
                 # Repeat without acknowledgement
                 ack = None
@@ -529,27 +644,37 @@ class UaClient:
                 self.logger.info("BadNoSubscription received, ignoring because it's probably valid.")
                 # End task
                 return
-            except UaStructParsingError:
+            try:
+                subscription_id = self._peek_subscription_id(data)
+            except Exception:
+                self.logger.exception("Error parsing notification from server")
                 ack = None
                 continue
-            subscription_id = response.Parameters.SubscriptionId
             if not subscription_id:
                 # The value 0 is used to indicate that there were no Subscriptions defined for which a
                 # response could be sent. See Spec. Part 4 - Section 5.13.5 "Publish"
                 # End task
                 return
-            try:
-                callback = self._subscription_callbacks[subscription_id]
-            except KeyError:
+            callback = self._subscription_callbacks.get(subscription_id)
+            if callback is None:
+                # Subscription is gone (e.g. it was just deleted); skip decoding the
+                # whole notification payload only to discard it.
                 self.logger.warning("Received data for unknown subscription %s active are %s", subscription_id, self._subscription_callbacks.keys())
-            else:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(response.Parameters)
-                    else:
-                        callback(response.Parameters)
-                except Exception:  # we call user code, catch everything!
-                    self.logger.exception("Exception while calling user callback: %s")
+                ack = None
+                continue
+            try:
+                response = _parse_response(ua.PublishResponse, data)
+            except Exception:
+                self.logger.exception("Error parsing notification from server")
+                ack = None
+                continue
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(response.Parameters)
+                else:
+                    callback(response.Parameters)
+            except Exception:  # we call user code, catch everything!
+                self.logger.exception("Exception while calling user callback: %s")
             # Repeat with acknowledgement
             if response.Parameters.NotificationMessage.NotificationData:
                 ack = ua.SubscriptionAcknowledgement()
@@ -562,122 +687,91 @@ class UaClient:
         self.logger.info("create_monitored_items")
         request = ua.CreateMonitoredItemsRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.CreateMonitoredItemsResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.CreateMonitoredItemsResponse)
         return response.Results
 
     async def delete_monitored_items(self, params):
         self.logger.info("delete_monitored_items")
         request = ua.DeleteMonitoredItemsRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.DeleteMonitoredItemsResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.DeleteMonitoredItemsResponse)
         return response.Results
 
     async def add_nodes(self, nodestoadd):
         self.logger.info("add_nodes")
         request = ua.AddNodesRequest()
         request.Parameters.NodesToAdd = nodestoadd
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.AddNodesResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.AddNodesResponse)
         return response.Results
 
     async def add_references(self, refs):
         self.logger.info("add_references")
         request = ua.AddReferencesRequest()
         request.Parameters.ReferencesToAdd = refs
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.AddReferencesResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.AddReferencesResponse)
         return response.Results
 
     async def delete_references(self, refs):
         self.logger.info("delete")
         request = ua.DeleteReferencesRequest()
         request.Parameters.ReferencesToDelete = refs
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.DeleteReferencesResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.DeleteReferencesResponse)
         return response.Parameters.Results
 
     async def delete_nodes(self, params):
         self.logger.info("delete_nodes")
         request = ua.DeleteNodesRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.DeleteNodesResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.DeleteNodesResponse)
         return response.Results
 
     async def call(self, methodstocall):
         request = ua.CallRequest()
         request.Parameters.MethodsToCall = methodstocall
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.CallResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.CallResponse)
         return response.Results
 
     async def history_read(self, params):
         self.logger.info("history_read")
         request = ua.HistoryReadRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.HistoryReadResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.HistoryReadResponse)
         return response.Results
 
     async def modify_monitored_items(self, params):
         self.logger.info("modify_monitored_items")
         request = ua.ModifyMonitoredItemsRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.ModifyMonitoredItemsResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.ModifyMonitoredItemsResponse)
         return response.Results
 
     async def register_nodes(self, nodes):
         self.logger.info("register_nodes")
         request = ua.RegisterNodesRequest()
         request.Parameters.NodesToRegister = nodes
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.RegisterNodesResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.RegisterNodesResponse)
         return response.Parameters.RegisteredNodeIds
 
     async def unregister_nodes(self, nodes):
         self.logger.info("unregister_nodes")
         request = ua.UnregisterNodesRequest()
         request.Parameters.NodesToUnregister = nodes
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.UnregisterNodesResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        await self._service_call(request, ua.UnregisterNodesResponse)
         # nothing to return for this service
 
     async def read_attributes(self, nodeids, attr):
         self.logger.info("read_attributes of several nodes")
         request = ua.ReadRequest()
+        # build the list locally so large batches do not pay the
+        # request.Parameters.NodesToRead attribute chain per element
+        nodes_to_read = []
         for nodeid in nodeids:
             rv = ua.ReadValueId()
             rv.NodeId = nodeid
             rv.AttributeId = attr
-            request.Parameters.NodesToRead.append(rv)
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.ReadResponse, data)
-        response.ResponseHeader.ServiceResult.check()
+            nodes_to_read.append(rv)
+        request.Parameters.NodesToRead = nodes_to_read
+        response = await self._service_call(request, ua.ReadResponse)
         return response.Results
 
     async def write_attributes(self, nodeids, datavalues, attributeid=ua.AttributeIds.Value):
@@ -687,15 +781,15 @@ class UaClient:
         """
         self.logger.info("write_attributes of several nodes")
         request = ua.WriteRequest()
-        for idx, nodeid in enumerate(nodeids):
+        nodes_to_write = []
+        for nodeid, datavalue in zip(nodeids, datavalues):
             attr = ua.WriteValue()
             attr.NodeId = nodeid
             attr.AttributeId = attributeid
-            attr.Value = datavalues[idx]
-            request.Parameters.NodesToWrite.append(attr)
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.WriteResponse, data)
-        response.ResponseHeader.ServiceResult.check()
+            attr.Value = datavalue
+            nodes_to_write.append(attr)
+        request.Parameters.NodesToWrite = nodes_to_write
+        response = await self._service_call(request, ua.WriteResponse)
         return response.Results
 
     async def set_monitoring_mode(self, params) -> ua.uatypes.StatusCode:
@@ -705,10 +799,7 @@ class UaClient:
         self.logger.info("set_monitoring_mode")
         request = ua.SetMonitoringModeRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.SetMonitoringModeResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.SetMonitoringModeResponse)
         return response.Parameters.Results
 
     async def set_publishing_mode(self, params) -> ua.uatypes.StatusCode:
@@ -718,8 +809,5 @@ class UaClient:
         self.logger.info("set_publishing_mode")
         request = ua.SetPublishingModeRequest()
         request.Parameters = params
-        data = await self.protocol.send_request(request)
-        response = struct_from_binary(ua.SetPublishingModeResponse, data)
-        self.logger.debug(response)
-        response.ResponseHeader.ServiceResult.check()
+        response = await self._service_call(request, ua.SetPublishingModeResponse)
         return response.Parameters.Results
@@ -76,13 +76,20 @@ class MessageChunk:
         return size // pbs * self.security_policy.encrypted_block_size()
 
     def to_binary(self):
+        # accumulate into bytearrays: in-place extends instead of a fresh bytes
+        # object per concatenation
         security = struct_to_binary(self.SecurityHeader)
-        encrypted_part = struct_to_binary(self.SequenceHeader) + self.Body
+        encrypted_part = bytearray(struct_to_binary(self.SequenceHeader))
+        encrypted_part += self.Body
         encrypted_part += self.security_policy.padding(len(encrypted_part))
         self.MessageHeader.body_size = len(security) + self.encrypted_size(len(encrypted_part))
         header = header_to_binary(self.MessageHeader)
         encrypted_part += self.security_policy.signature(header + security + encrypted_part)
-        return header + security + self.security_policy.encrypt(encrypted_part)
+        data = bytearray(header)
+        data += security
+        # crypto backends want plain bytes, so materialize once right before encrypting
+        data += self.security_policy.encrypt(bytes(encrypted_part))
+        return data
 
     @staticmethod
     def max_body_size(crypto, max_chunk_size):
@@ -269,7 +276,13 @@ class SecureConnection:
                 logger.debug("Wrapping sequence number: %d -> 1", self._sequence_number)
                 self._sequence_number = 1
             chunk.SequenceHeader.SequenceNumber = self._sequence_number
-        return b"".join([chunk.to_binary() for chunk in chunks])
+        if len(chunks) == 1:
+            # common case: the message fits in one chunk, hand its buffer out as-is
+            return chunks[0].to_binary()
+        data = bytearray()
+        for chunk in chunks:
+            data += chunk.to_binary()
+        return data
 
     def _check_sym_header(self, security_hdr):
         """
@@ -8,7 +8,6 @@ import pickle
 import shelve
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import partial
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -598,8 +597,8 @@ class MethodService:
     async def _run_method(self, func, parent, *args):
         if asyncio.iscoroutinefunction(func):
             return await func(parent, *args)
-        p = partial(func, parent, *args)
-        res = await asyncio.get_event_loop().run_in_executor(self._pool, p)
+        # run_in_executor passes the arguments through itself, no partial needed
+        res = await asyncio.get_event_loop().run_in_executor(self._pool, func, parent, *args)
         return res
 
 
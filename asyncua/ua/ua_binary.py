@@ -121,12 +121,14 @@ class _Primitive1:
         st = struct.Struct(fmt.format(1))
         self.size = st.size
         self.format = st.format
-
-    def pack(self, data):
-        return struct.pack(self.format, data)
+        # bind the precompiled Struct methods directly; every primitive field of
+        # every message goes through these, so skipping the per-call format
+        # lookup in struct.pack/unpack adds up
+        self.pack = st.pack
+        self._unpack_st = st.unpack
 
     def unpack(self, data):
-        return struct.unpack(self.format, data.read(self.size))[0]
+        return self._unpack_st(data.read(self.size))[0]
 
     def pack_array(self, data):
         if data is None:
@@ -416,8 +418,23 @@ def nodeid_to_binary(nodeid):
     return data
 
 
+# fast path for the dominant wire format: plain FourByteNodeId, namespace byte
+# plus UInt16 identifier, no NamespaceUri/ServerIndex flag bits set
+_FOURBYTE_UNPACK = struct.Struct('<BH').unpack
+
+
+@functools.lru_cache(maxsize=4096)
+def _fourbyte_nodeid(nidx, identifier):
+    # TypeIds are FourByte and drawn from a small set, so memoizing the decoded
+    # NodeIds pays off; NodeId is a frozen dataclass, sharing instances is safe
+    return ua.NodeId(identifier, nidx, ua.NodeIdType.FourByte)
+
+
 def nodeid_from_binary(data):
     encoding = ord(data.read(1))
+    if encoding == 0x01:
+        nidx, identifier = _FOURBYTE_UNPACK(data.read(3))
+        return _fourbyte_nodeid(nidx, identifier)
     nidtype = ua.NodeIdType(encoding & 0b00111111)
     uri = None
     server_idx = None
@@ -645,6 +662,16 @@ def _create_dataclass_deserializer(objtype):
             deserialize_field = _create_type_deserializer(field_type)
         field_deserializers.append((field, optional_enc_bit, deserialize_field))
 
+    if enc_count == 0 and all(field.name != "Encoding" for field, _, _ in field_deserializers):
+        # specialized decoder for the common case (no Encoding mask, no
+        # optional fields): all fields are always present, so decode them
+        # in a straight run without per-field branching
+        plain_deserializers = [(field.name, deserialize_field) for field, _, deserialize_field in field_deserializers]
+
+        def decode_plain(data):
+            return objtype(**{name: deserialize_field(data) for name, deserialize_field in plain_deserializers})
+        return decode_plain
+
     def decode(data):
         kwargs = {}
         enc = 0
@@ -664,20 +691,23 @@ def struct_from_binary(objtype, data):
     return _create_dataclass_deserializer(objtype)(data)
 
 
+# precompiled layouts of the fixed OPC UA TCP message header (specs Part 6, 7.1.2),
+# with and without the ChannelId of the secure conversation variant
+_HEADER_PACK = struct.Struct('<3ssI').pack
+_SECURE_HEADER_PACK = struct.Struct('<3ssII').pack
+_HEADER_UNPACK = struct.Struct('<3scI').unpack
+
+
 def header_to_binary(hdr):
-    b = [struct.pack("<3ss", hdr.MessageType, hdr.ChunkType)]
     size = hdr.body_size + 8
     if hdr.MessageType in (ua.MessageType.SecureOpen, ua.MessageType.SecureClose, ua.MessageType.SecureMessage):
-        size += 4
-    b.append(Primitives.UInt32.pack(size))
-    if hdr.MessageType in (ua.MessageType.SecureOpen, ua.MessageType.SecureClose, ua.MessageType.SecureMessage):
-        b.append(Primitives.UInt32.pack(hdr.ChannelId))
-    return b"".join(b)
+        return _SECURE_HEADER_PACK(hdr.MessageType, hdr.ChunkType, size + 4, hdr.ChannelId)
+    return _HEADER_PACK(hdr.MessageType, hdr.ChunkType, size)
 
 
 def header_from_binary(data):
     hdr = ua.Header()
-    hdr.MessageType, hdr.ChunkType, hdr.packet_size = struct.unpack("<3scI", data.read(8))
+    hdr.MessageType, hdr.ChunkType, hdr.packet_size = _HEADER_UNPACK(data.read(8))
     hdr.body_size = hdr.packet_size - 8
     if hdr.MessageType in (ua.MessageType.SecureOpen, ua.MessageType.SecureClose, ua.MessageType.SecureMessage):
         hdr.body_size -= 4